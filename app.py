@@ -1,43 +1,37 @@
 import os
 import cv2
-import numpy as np
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
 import json
-import google.generativeai as genai
+import threading
 from datetime import datetime
 import time
+from prometheus_client import Counter, Histogram, start_http_server
 
-# Load environment variables and configure Gemini
+# Load environment variables
 load_dotenv()
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 if not GOOGLE_API_KEY:
     raise ValueError("Please set GOOGLE_API_KEY in your .env file.")
 
-genai.configure(api_key=GOOGLE_API_KEY)
-
-# Define the Pydantic model for structured output
-class VehicleData(BaseModel):
-    number_plate: str = Field(description="The number plate of the vehicle")
-    vehicle_type: str = Field(description="The type of vehicle (e.g., two_wheeler, four_wheeler)")
-
-# Initialize LangChain’s Gemini model
-llm = ChatGoogleGenerativeAI(
-    model="gemini-1.5-flash",
-    google_api_key=GOOGLE_API_KEY,
-    temperature=0.0
+# Capture metrics, served on CAPTURE_METRICS_PORT when set
+CAPTURE_STAGE_SECONDS = Histogram(
+    "autolog_capture_stage_duration_seconds",
+    "Time spent in each stage of the capture loop",
+    ["stage"],
 )
-
-
-
-
-
-# Set up the prompt template for formatting the output
-prompt_template = PromptTemplate(
-    template="""Analyze this image and identify:
+FRAME_READ_SECONDS = CAPTURE_STAGE_SECONDS.labels("frame_read")
+MOTION_DETECTION_SECONDS = CAPTURE_STAGE_SECONDS.labels("motion_detection")
+ENCODE_SECONDS = CAPTURE_STAGE_SECONDS.labels("encode")
+MODEL_CALL_SECONDS = CAPTURE_STAGE_SECONDS.labels("model_call")
+SAVE_SECONDS = CAPTURE_STAGE_SECONDS.labels("save")
+
+FRAMES_TOTAL = Counter("autolog_capture_frames_total", "Frames read from the camera")
+MOTION_FRAMES_TOTAL = Counter("autolog_capture_motion_frames_total", "Frames where motion was detected")
+CAPTURES_TOTAL = Counter("autolog_captures_total", "Vehicle images recognised and saved")
+CAPTURE_ERRORS_TOTAL = Counter("autolog_capture_errors_total", "Captures that failed during recognition or saving")
+
+# Prompt for formatting the output (a plain string, so it costs nothing at import)
+PROMPT_TEMPLATE = """Analyze this image and identify:
         1. The license plate number (if visible)
         2. The vehicle type (must be one of: Bike, Car, Truck, Scooter, Others)
         
@@ -46,20 +40,59 @@ prompt_template = PromptTemplate(
           "licensePlate": "the license plate text or null if not visible",
           "vehicleType": "one of: Bike, Car, Truck, Scooter, Others",
           "confidence": "high/medium/low"
-        {parser_instructions}""",
-    input_variables=["number_plate", "vehicle_type"],
-    partial_variables={"parser_instructions": PydanticOutputParser(pydantic_object=VehicleData).get_format_instructions()}
-)
-
-# Set up the output parser
-parser = PydanticOutputParser(pydantic_object=VehicleData)
-
-# Create the chain for formatting
-chain = prompt_template | llm | parser
+        {parser_instructions}"""
+
+# Gemini, LangChain and Pydantic take seconds to import, so the recognition clients are
+# built on first use (or in the background once the camera is open) and then reused
+_clients = None
+_clients_lock = threading.Lock()
+
+def get_recognition_clients():
+    """Return the (Gemini model, LangChain formatting chain) pair, building it on first call."""
+    global _clients
+    with _clients_lock:
+        if _clients is not None:
+            return _clients
+
+        import google.generativeai as genai
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        from langchain_core.prompts import PromptTemplate
+        from langchain_core.output_parsers import PydanticOutputParser
+        from pydantic import BaseModel, Field
+
+        genai.configure(api_key=GOOGLE_API_KEY)
+
+        # Define the Pydantic model for structured output
+        class VehicleData(BaseModel):
+            number_plate: str = Field(description="The number plate of the vehicle")
+            vehicle_type: str = Field(description="The type of vehicle (e.g., two_wheeler, four_wheeler)")
+
+        # Initialize LangChain’s Gemini model
+        llm = ChatGoogleGenerativeAI(
+            model="gemini-1.5-flash",
+            google_api_key=GOOGLE_API_KEY,
+            temperature=0.0
+        )
+
+        # Set up the output parser
+        parser = PydanticOutputParser(pydantic_object=VehicleData)
+
+        # Set up the prompt template for formatting the output
+        prompt_template = PromptTemplate(
+            template=PROMPT_TEMPLATE,
+            input_variables=["number_plate", "vehicle_type"],
+            partial_variables={"parser_instructions": parser.get_format_instructions()}
+        )
+
+        # Create the chain for formatting
+        chain = prompt_template | llm | parser
+
+        _clients = (genai.GenerativeModel("gemini-1.5-flash"), chain)
+        return _clients
 
 def process_vehicle_image(image_data: bytes) -> str:
     """Process the vehicle image using Gemini 1.5 Flash and return JSON output."""
-    model = genai.GenerativeModel("gemini-1.5-flash")
+    model, chain = get_recognition_clients()
     response = model.generate_content([
         "Analyze this vehicle image and extract the number plate and vehicle type. Return the result in the format:\nNumber Plate: <plate>\nVehicle Type: <type>",
         {"mime_type": "image/jpeg", "data": image_data}
@@ -78,27 +111,38 @@ def process_vehicle_image(image_data: bytes) -> str:
     json_output = json.dumps(result.dict(), indent=2)
     return json_output
 
-def stream_and_auto_capture(ip_camera_url: str):
-    """Stream video from phone camera and automatically capture vehicle images using motion detection."""
+def stream_and_auto_capture(ip_camera_url: str, camera=None, recognize=None, cooldown: float = 2.0, show_window: bool = True):
+    """Stream video from phone camera and automatically capture vehicle images using motion detection.
+
+    `camera` and `recognize` can be swapped out (e.g. for a frame replay and a fake model when benchmarking).
+    """
     # Initialize the camera stream
-    camera = cv2.VideoCapture(ip_camera_url)
-    
+    if camera is None:
+        camera = cv2.VideoCapture(ip_camera_url)
     if not camera.isOpened():
         raise ValueError(f"Error: Could not open camera stream at {ip_camera_url}")
 
+    if recognize is None:
+        recognize = process_vehicle_image
+        # Warm the clients up while we wait for the first car
+        threading.Thread(target=get_recognition_clients, daemon=True).start()
+
     capture_count = 0
     prev_frame = None
     min_contour_area = 5000  # Minimum area for motion detection (adjust as needed)
-    cooldown = 2.0  # Seconds to wait between captures
     last_capture_time = 0
 
     print("Streaming video from phone camera... Press 'q' to quit.")
 
     while True:
-        ret, frame = camera.read()
+        with FRAME_READ_SECONDS.time():
+            ret, frame = camera.read()
         if not ret:
             print("Error: Could not read frame")
             break
+        FRAMES_TOTAL.inc()
+
+        motion_start = time.perf_counter()
 
         # Convert to grayscale and blur for motion detection
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
@@ -126,32 +170,44 @@ def stream_and_auto_capture(ip_camera_url: str):
             (x, y, w, h) = cv2.boundingRect(contour)
             cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
 
+        MOTION_DETECTION_SECONDS.observe(time.perf_counter() - motion_start)
+        if motion_detected:
+            MOTION_FRAMES_TOTAL.inc()
+
         # If motion is detected and cooldown period has passed, capture and process
         current_time = time.time()
         if motion_detected and (current_time - last_capture_time) > cooldown:
             # Capture the clear frame
-            _, buffer = cv2.imencode('.jpg', frame)
-            image_data = buffer.tobytes()
+            with ENCODE_SECONDS.time():
+                _, buffer = cv2.imencode('.jpg', frame)
+                image_data = buffer.tobytes()
 
             # Process with Gemini and print only the required output
             try:
-                result = process_vehicle_image(image_data)
+                with MODEL_CALL_SECONDS.time():
+                    result = recognize(image_data)
                 print("Vehicle Data:")
                 print(result)
 
                 # Save the image and print the path
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 image_path = f"vehicle_{timestamp}_{capture_count}.jpg"
-                cv2.imwrite(image_path, frame)
+                with SAVE_SECONDS.time():
+                    cv2.imwrite(image_path, frame)
                 print(f"Saved as: {image_path}")
+                CAPTURES_TOTAL.inc()
                 capture_count += 1
                 last_capture_time = current_time
             except Exception as e:
+                CAPTURE_ERRORS_TOTAL.inc()
                 print(f"Error processing image: {e}")
 
         # Update previous frame
         prev_frame = gray
 
+        if not show_window:
+            continue
+
         # Display the frame
         cv2.imshow('Phone Camera Stream', frame)
 
@@ -161,12 +217,16 @@ def stream_and_auto_capture(ip_camera_url: str):
 
     # Clean up
     camera.release()
-    cv2.destroyAllWindows()
+    if show_window:
+        cv2.destroyAllWindows()
 
 # Example usage
 if __name__ == "__main__":
     # Replace with your phone's IP Webcam URL (e.g., http://192.168.1.100:8080/video)
     IP_CAMERA_URL = "http://192.168.1.4:8080/video"  # Update this with your IP address
+    METRICS_PORT = os.getenv("CAPTURE_METRICS_PORT")
+    if METRICS_PORT:
+        start_http_server(int(METRICS_PORT))
     try:
         stream_and_auto_capture(IP_CAMERA_URL)
     except Exception as e:
@@ -0,0 +1,144 @@
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+
+
+@dataclass(frozen=True)
+class TimeBand:
+    """Hours in [start_hour, end_hour) are charged at `multiplier` times the hourly rate."""
+    start_hour: int
+    end_hour: int
+    multiplier: float
+
+
+@dataclass(frozen=True)
+class Tariff:
+    hourly_rates: Dict[str, float]
+    # Stays up to this long are free
+    grace_minutes: float = 0.0
+    # Never charge more than this many (banded) hours per 24 hours parked
+    daily_cap_hours: Optional[float] = None
+    bands: Tuple[TimeBand, ...] = ()
+
+    def hour_multipliers(self) -> np.ndarray:
+        """Rate multiplier for each hour of the day, 0-23."""
+        multipliers = np.ones(24)
+        for band in self.bands:
+            hours = np.arange(band.start_hour, band.end_hour + (24 if band.end_hour <= band.start_hour else 0)) % 24
+            multipliers[hours] = band.multiplier
+        return multipliers
+
+
+TIME_BAND = re.compile(r"^(\d{1,2})-(\d{1,2}):(\d+(?:\.\d+)?)$")
+
+
+def parse_time_bands(spec: str) -> Tuple[TimeBand, ...]:
+    """Parse "8-10:1.5,17-20:1.5" into bands. A band like "22-6:0.5" wraps past midnight."""
+    bands = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        match = TIME_BAND.match(item)
+        if not match:
+            raise ValueError(f"Invalid FARE_TIME_BANDS entry '{item}', expected START-END:MULTIPLIER like 8-10:1.5")
+        start_hour, end_hour, multiplier = int(match.group(1)), int(match.group(2)), float(match.group(3))
+        if start_hour > 23 or end_hour > 24:
+            raise ValueError(f"Invalid FARE_TIME_BANDS entry '{item}', hours must be between 0 and 24")
+        bands.append(TimeBand(start_hour, end_hour % 24, multiplier))
+    return tuple(bands)
+
+
+class MissingRateError(ValueError):
+    """A stay's vehicle type has no row in `parking_rates`."""
+
+
+def compute_fees(tariff: Tariff, vehicle_types: Sequence[str], entry_times, duration_minutes) -> np.ndarray:
+    """
+    Fees for many stays at once. `entry_times` are local wall-clock times, only used to find
+    the time-of-day band; `duration_minutes` is the real time parked, so a stay across a
+    daylight saving change is billed for the time it actually lasted.
+
+    Every started hour is charged (at least one) at the rate of the band it starts in; stays
+    within a non-zero grace period are free and each 24 hours is capped.
+    """
+    missing = set(vehicle_types) - set(tariff.hourly_rates)
+    if missing:
+        raise MissingRateError(f"No parking rate configured for vehicle type: {', '.join(sorted(map(str, missing)))}")
+
+    entry_times = np.asarray(entry_times, dtype="datetime64[s]")
+    duration_minutes = np.asarray(duration_minutes, dtype=float)
+    rates = np.array([tariff.hourly_rates[vehicle_type] for vehicle_type in vehicle_types], dtype=float)
+
+    billed_hours = np.maximum(np.ceil(duration_minutes / 60), 1).astype(np.int64)
+
+    # Sum of multipliers over billed hours: whole days plus a partial day starting at the entry hour.
+    # Tiling the 24 hourly multipliers twice lets a prefix-sum lookup handle wrapping past midnight.
+    multipliers = tariff.hour_multipliers()
+    cumulative = np.concatenate(([0.0], np.cumsum(np.tile(multipliers, 2))))
+    entry_hours = ((entry_times - entry_times.astype("datetime64[D]")) // np.timedelta64(1, "h")).astype(np.int64)
+    full_days, remaining_hours = np.divmod(billed_hours, 24)
+    partial_day = cumulative[entry_hours + remaining_hours] - cumulative[entry_hours]
+
+    full_day_fee = rates * multipliers.sum()
+    partial_day_fee = rates * partial_day
+    if tariff.daily_cap_hours is not None:
+        cap = rates * tariff.daily_cap_hours
+        full_day_fee = np.minimum(full_day_fee, cap)
+        partial_day_fee = np.minimum(partial_day_fee, cap)
+
+    fees = full_days * full_day_fee + partial_day_fee
+    if tariff.grace_minutes > 0:
+        fees[duration_minutes <= tariff.grace_minutes] = 0.0
+    return np.round(fees, 2)
+
+
+class TariffCache:
+    """
+    Hourly rates from `parking_rates` plus the configured bands, grace period and cap.
+    Loaded on first use and kept until `invalidate` (called when a rate is updated).
+    Entry times are passed to `compute_fees` as wall-clock times in `time_zone`, which is
+    what the time-of-day bands refer to.
+    """
+
+    def __init__(self, grace_minutes: float = 0.0, daily_cap_hours: Optional[float] = None,
+                 bands: Tuple[TimeBand, ...] = (), time_zone: str = "UTC"):
+        self.time_zone = time_zone
+        self.grace_minutes = grace_minutes
+        self.daily_cap_hours = daily_cap_hours
+        self.bands = bands
+        self._tariff = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        daily_cap_hours = os.environ.get("FARE_DAILY_CAP_HOURS")
+        return cls(
+            grace_minutes=float(os.environ.get("FARE_GRACE_MINUTES", 0)),
+            daily_cap_hours=float(daily_cap_hours) if daily_cap_hours else None,
+            bands=parse_time_bands(os.environ.get("FARE_TIME_BANDS", "")),
+            time_zone=os.environ.get("FARE_TIME_ZONE", "UTC"),
+        )
+
+    @property
+    def has_rules(self) -> bool:
+        """Whether anything beyond the plain hourly rate is configured."""
+        return self.grace_minutes > 0 or self.daily_cap_hours is not None or bool(self.bands)
+
+    def get(self, db) -> Tariff:
+        with self._lock:
+            if self._tariff is None:
+                rows = db.execute(text("SELECT vehicle_type, hourly_rate FROM parking_rates")).fetchall()
+                self._tariff = Tariff(
+                    hourly_rates={vehicle_type: float(hourly_rate) for vehicle_type, hourly_rate in rows},
+                    grace_minutes=self.grace_minutes,
+                    daily_cap_hours=self.daily_cap_hours,
+                    bands=self.bands,
+                )
+            return self._tariff
+
+    def invalidate(self):
+        with self._lock:
+            self._tariff = None
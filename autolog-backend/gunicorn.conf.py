@@ -0,0 +1,40 @@
+# Production server: gunicorn managing uvicorn workers
+#   gunicorn main:app -c gunicorn.conf.py
+import os
+import shutil
+
+# CPUs this process may actually run on, capped so a big host doesn't spawn a worker
+# (and a connection pool) per core it can't use
+MAX_WORKERS = int(os.environ.get("MAX_WORKERS", 4))
+
+# sched_getaffinity is Linux-only; macOS dev machines fall back to the CPU count
+AVAILABLE_CPUS = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", min(AVAILABLE_CPUS, MAX_WORKERS)))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = 60
+# Let in-flight requests finish and the lifespan shutdown dispose the pool
+graceful_timeout = 30
+
+# Workers size their connection pools to share DB_MAX_CONNECTIONS between them
+os.environ["AUTOLOG_WORKERS"] = str(workers)
+
+# Workers don't share memory, so fan dedup/cache events out through Postgres
+os.environ.setdefault("SHARED_STATE_BACKEND", "postgres" if workers > 1 else "memory")
+
+# Each worker writes its metrics here so /metrics can add them up
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/autolog-metrics")
+
+
+def on_starting(server):
+    # Samples left over from a previous run would be added to this one's
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
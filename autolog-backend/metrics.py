@@ -0,0 +1,102 @@
+import os
+import re
+import time
+from functools import lru_cache
+
+from fastapi import Request, Response
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Histogram, generate_latest, multiprocess
+from prometheus_client.core import GaugeMetricFamily, REGISTRY
+from sqlalchemy import event
+
+REQUEST_LATENCY = Histogram(
+    "autolog_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+)
+
+DB_QUERY_LATENCY = Histogram(
+    "autolog_db_query_duration_seconds",
+    "Database statement latency by statement name",
+    ["statement"],
+)
+
+# SQL functions are named after themselves, e.g. "get_dashboard_data" or "get_analytics_data"
+FUNCTION_CALL = re.compile(r"^\s*SELECT\s+(?:\*\s+FROM\s+)?(\w+)\s*\(", re.IGNORECASE)
+# Anything else becomes "<verb> <table>", e.g. "insert vehicle_records"
+TABLE_STATEMENT = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE)\b(?:.*?\b(?:FROM|INTO)\b)?\s+(\w+)",
+                             re.IGNORECASE | re.DOTALL)
+
+
+@lru_cache(maxsize=256)
+def statement_name(statement: str) -> str:
+    match = FUNCTION_CALL.match(statement)
+    if match:
+        return match.group(1).lower()
+    match = TABLE_STATEMENT.match(statement)
+    if match:
+        return f"{match.group(1).lower()} {match.group(2).lower()}"
+    return "other"
+
+
+class PoolCollector:
+    """Reports connection pool usage at scrape time."""
+
+    def __init__(self):
+        self.engine = None
+
+    def collect(self):
+        if self.engine is None:
+            return
+        pool = self.engine.pool
+        for name, documentation, getter in (
+            ("autolog_db_pool_size", "Configured pool size", "size"),
+            ("autolog_db_pool_checked_out", "Connections currently in use", "checkedout"),
+            ("autolog_db_pool_checked_in", "Idle connections in the pool", "checkedin"),
+            ("autolog_db_pool_overflow", "Connections opened beyond the pool size", "overflow"),
+        ):
+            # NullPool/StaticPool don't implement every counter
+            if hasattr(pool, getter):
+                yield GaugeMetricFamily(name, documentation, value=getattr(pool, getter)())
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def instrument_engine(engine):
+    """Time every statement executed on `engine` and expose its pool usage."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        DB_QUERY_LATENCY.labels(statement_name(statement)).observe(time.perf_counter() - context._query_start)
+
+    pool_collector.engine = engine
+
+
+async def metrics_middleware(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Use the route template so /vehicles/{license_plate}/exit is one series, not one per plate
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        REQUEST_LATENCY.labels(request.method, path, str(status)).observe(time.perf_counter() - start)
+
+
+def metrics_endpoint():
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Under gunicorn every worker writes its samples to files; add them all up.
+        # Pool gauges can't be merged that way and describe the worker serving the scrape.
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(pool_collector)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,75 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# What the recognition model returns when it can't read a plate
+UNREADABLE_PLATES = {"", "NOTDETECTED", "NULL", "NONE", "UNKNOWN", "NA"}
+
+NON_ALPHANUMERIC = re.compile(r"[^A-Z0-9]")
+
+
+def normalize_plate(raw: Optional[str]) -> Optional[str]:
+    """Canonical plate text: "mh 12-ab 1234" -> "MH12AB1234". None if there is no usable plate."""
+    if raw is None:
+        return None
+    plate = NON_ALPHANUMERIC.sub("", raw.upper())
+    if plate in UNREADABLE_PLATES:
+        return None
+    return plate
+
+
+class EntryDeduplicator:
+    """
+    Remembers recent (plate, gate) sightings so a car lingering in front of the camera
+    is only logged once, until it has been out of view for a whole window. Lookups and
+    inserts are O(1); entries are kept in order of last sighting so expired ones are
+    evicted from the front.
+    """
+
+    def __init__(self, window_seconds: float = 300.0):
+        self.window_seconds = window_seconds
+        self._seen = OrderedDict()  # (plate, gate) -> last seen
+        self._gates_by_plate = {}  # plate -> {gate}, so an exit can forget every gate
+        self._lock = threading.Lock()
+
+    def check_and_record(self, plate: str, gate: str, now: Optional[float] = None) -> bool:
+        """Record an entry. Returns False if the same plate was seen at this gate within the window."""
+        now = time.monotonic() if now is None else now
+        key = (plate, gate)
+        with self._lock:
+            self._evict(now)
+            if key in self._seen:
+                # Still in view: slide the window so a lingering car keeps being ignored
+                self._seen[key] = now
+                self._seen.move_to_end(key)
+                return False
+            self._seen[key] = now
+            self._gates_by_plate.setdefault(plate, set()).add(gate)
+            return True
+
+    def forget(self, plate: str, gate: Optional[str] = None):
+        """Drop a plate (at one gate, or all of them), e.g. when the vehicle exits or the insert failed."""
+        with self._lock:
+            gates = self._gates_by_plate.get(plate, set())
+            for g in ([gate] if gate is not None else list(gates)):
+                self._seen.pop((plate, g), None)
+                gates.discard(g)
+            if not gates:
+                self._gates_by_plate.pop(plate, None)
+
+    def __len__(self):
+        return len(self._seen)
+
+    def _evict(self, now: float):
+        while self._seen:
+            (plate, gate), seen_at = next(iter(self._seen.items()))
+            if now - seen_at < self.window_seconds:
+                break
+            self._seen.popitem(last=False)
+            gates = self._gates_by_plate.get(plate)
+            if gates is not None:
+                gates.discard(gate)
+                if not gates:
+                    del self._gates_by_plate[plate]
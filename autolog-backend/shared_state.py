@@ -0,0 +1,126 @@
+import json
+import os
+import re
+import select
+import socket
+import threading
+
+from sqlalchemy import text
+
+CHANNEL_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+class SharedState:
+    """
+    Fans events out to the other worker processes, e.g. to invalidate their caches.
+    `publish` only reaches *other* workers: the publisher is expected to have applied
+    the change locally already. With a single worker there is no one to tell, so this
+    base class just keeps the subscriptions.
+    """
+
+    # Database connections held outside the engine's pool
+    connections = 0
+
+    def __init__(self):
+        self._subscribers = {}
+
+    def subscribe(self, channel, callback):
+        """Call `callback(message)` for every event on `channel`. Subscribe before `start`."""
+        if not CHANNEL_NAME.match(channel):
+            raise ValueError(f"Invalid channel name: {channel}")
+        self._subscribers.setdefault(channel, []).append(callback)
+
+    def publish(self, channel, message):
+        pass
+
+    def start(self, engine):
+        pass
+
+    def stop(self):
+        pass
+
+    def _deliver(self, channel, message):
+        for callback in self._subscribers.get(channel, []):
+            try:
+                callback(message)
+            except Exception as e:
+                print(f"Error handling {channel} event: {e}")
+
+
+class PostgresSharedState(SharedState):
+    """Uses LISTEN/NOTIFY on the application database, so no extra service is needed."""
+
+    connections = 1
+
+    def __init__(self):
+        super().__init__()
+        self.origin = None
+        self.engine = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def publish(self, channel, message):
+        payload = json.dumps({"origin": self.origin, "message": message}, default=str)
+        # Best effort: the request that triggered the event has already succeeded
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload})
+        except Exception as e:
+            print(f"Error publishing {channel} event: {e}")
+
+    def start(self, engine):
+        self.engine = engine
+        # Workers are forked from one master, so the pid is only known here
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="shared-state-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _listen(self):
+        # Reconnect after database restarts until the worker shuts down
+        while not self._stop.is_set():
+            try:
+                self._listen_until_stopped()
+            except Exception as e:
+                print(f"Shared state listener error: {e}")
+                self._stop.wait(1)
+
+    def _listen_until_stopped(self):
+        connection = self.engine.raw_connection()
+        # LISTEN holds the connection for good, so take it out of the pool
+        connection.detach()
+        dbapi_connection = connection.dbapi_connection
+        try:
+            dbapi_connection.autocommit = True
+            cursor = dbapi_connection.cursor()
+            for channel in self._subscribers:
+                cursor.execute(f"LISTEN {channel}")
+
+            while not self._stop.is_set():
+                if select.select([dbapi_connection], [], [], 1.0) == ([], [], []):
+                    continue
+                dbapi_connection.poll()
+                while dbapi_connection.notifies:
+                    notify = dbapi_connection.notifies.pop(0)
+                    event = json.loads(notify.payload)
+                    if event["origin"] != self.origin:
+                        self._deliver(notify.channel, event["message"])
+        finally:
+            connection.close()
+
+
+BACKENDS = {
+    "memory": SharedState,
+    "postgres": PostgresSharedState,
+}
+
+
+def create_shared_state(backend: str) -> SharedState:
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown shared state backend '{backend}', expected one of: {', '.join(BACKENDS)}")
+    return BACKENDS[backend]()
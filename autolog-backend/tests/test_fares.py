@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from fares import MissingRateError, Tariff, TimeBand, compute_fees, parse_time_bands
+
+RATES = {"car": 20.0, "bike": 10.0}
+
+
+def fee(tariff, entry_time, exit_time, vehicle_type="car"):
+    duration_minutes = (exit_time - entry_time).total_seconds() / 60
+    return compute_fees(tariff, [vehicle_type], [entry_time], [duration_minutes])[0]
+
+
+def test_every_started_hour_is_charged():
+    tariff = Tariff(RATES)
+    entry_time = datetime(2026, 1, 1, 9, 30)
+    assert fee(tariff, entry_time, entry_time + timedelta(minutes=10)) == 20
+    assert fee(tariff, entry_time, entry_time + timedelta(minutes=60)) == 20
+    assert fee(tariff, entry_time, entry_time + timedelta(minutes=61)) == 40
+    assert fee(tariff, entry_time, entry_time + timedelta(minutes=61), "bike") == 20
+
+
+def test_default_tariff_charges_at_least_one_hour():
+    tariff = Tariff(RATES)
+    entry_time = datetime(2026, 1, 1, 9, 30)
+    assert fee(tariff, entry_time, entry_time) == 20
+    assert fee(tariff, entry_time, entry_time + timedelta(seconds=1)) == 20
+
+
+def test_duration_is_billed_not_wall_clock():
+    # 01:30 local, but the clocks went forward during the stay: 60 real minutes is one hour
+    tariff = Tariff(RATES)
+    assert compute_fees(tariff, ["car"], [datetime(2026, 3, 29, 1, 30)], [60])[0] == 20
+
+
+def test_missing_rate():
+    with pytest.raises(MissingRateError, match="truck"):
+        compute_fees(Tariff(RATES), ["car", "truck"], [datetime(2026, 1, 1)] * 2, [30, 30])
+
+
+def test_band_starting_mid_stay():
+    tariff = Tariff(RATES, bands=parse_time_bands("22-6:0.5"))
+    # 21:30-23:10 is two started hours: 21:30 at the full rate, 22:30 at half rate
+    assert fee(tariff, datetime(2026, 1, 1, 21, 30), datetime(2026, 1, 1, 23, 10)) == 30
+
+
+def test_band_wraps_past_midnight():
+    tariff = Tariff(RATES, bands=parse_time_bands("22-6:0.5"))
+    # 20:00-06:00: hours 20 and 21 at the full rate, 22 through 05 at half rate
+    assert fee(tariff, datetime(2026, 1, 1, 20), datetime(2026, 1, 2, 6)) == 20 * (2 + 8 * 0.5)
+
+
+def test_daily_cap():
+    tariff = Tariff(RATES, daily_cap_hours=10)
+    # 30 hours: the first 24 are capped at 10 hours, the remaining 6 are under the cap
+    assert fee(tariff, datetime(2026, 1, 1, 8), datetime(2026, 1, 2, 14)) == 20 * 10 + 20 * 6
+
+
+def test_daily_cap_applies_to_each_day():
+    tariff = Tariff(RATES, daily_cap_hours=10)
+    assert fee(tariff, datetime(2026, 1, 1, 8), datetime(2026, 1, 3, 20)) == 20 * 10 * 3
+
+
+def test_grace_period():
+    tariff = Tariff(RATES, grace_minutes=15)
+    entry_time = datetime(2026, 1, 1, 9)
+    assert fee(tariff, entry_time, entry_time + timedelta(minutes=10)) == 0
+    assert fee(tariff, entry_time, entry_time + timedelta(minutes=15)) == 0
+    assert fee(tariff, entry_time, entry_time + timedelta(minutes=16)) == 20
+
+
+def test_batch_matches_single_stays():
+    tariff = Tariff(RATES, grace_minutes=5, daily_cap_hours=12, bands=parse_time_bands("8-10:1.5,22-6:0.5"))
+    start = datetime(2026, 1, 1)
+    entry_times = [start + timedelta(minutes=37 * i) for i in range(200)]
+    exit_times = [entry_time + timedelta(minutes=53 * i) for i, entry_time in enumerate(entry_times)]
+    vehicle_types = ["car" if i % 3 else "bike" for i in range(200)]
+
+    duration_minutes = [(exit_time - entry_time).total_seconds() / 60
+                        for entry_time, exit_time in zip(entry_times, exit_times)]
+    batch = compute_fees(tariff, vehicle_types, entry_times, duration_minutes)
+    single = [fee(tariff, *stay) for stay in zip(entry_times, exit_times, vehicle_types)]
+    np.testing.assert_array_equal(batch, single)
+
+
+def test_empty_batch():
+    assert len(compute_fees(Tariff(RATES), [], [], [])) == 0
+
+
+def test_parse_time_bands():
+    assert parse_time_bands("") == ()
+    assert parse_time_bands("8-10:1.5, 22-6:0.5") == (TimeBand(8, 10, 1.5), TimeBand(22, 6, 0.5))
+    assert parse_time_bands("0-24:2") == (TimeBand(0, 0, 2.0),)
+
+
+@pytest.mark.parametrize("spec", ["8-10", "8:1.5", "8-10:x", "25-3:1", "8-30:1", "8-10:-1"])
+def test_parse_time_bands_rejects_invalid(spec):
+    with pytest.raises(ValueError, match="FARE_TIME_BANDS"):
+        parse_time_bands(spec)
@@ -0,0 +1,67 @@
+import pytest
+
+from plates import EntryDeduplicator, normalize_plate
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("MH 12 AB 1234", "MH12AB1234"),
+    ("MH12AB1234", "MH12AB1234"),
+    ("mh-12-ab-1234", "MH12AB1234"),
+    ("  ka 01 ha 9999\n", "KA01HA9999"),
+])
+def test_normalize_plate(raw, expected):
+    assert normalize_plate(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [None, "", "   ", "Not detected", "null", "N/A", "unknown"])
+def test_normalize_plate_unreadable(raw):
+    assert normalize_plate(raw) is None
+
+
+def test_duplicate_rejected_within_window():
+    dedup = EntryDeduplicator(window_seconds=10)
+    assert dedup.check_and_record("MH12AB1234", "main", now=0)
+    assert not dedup.check_and_record("MH12AB1234", "main", now=5)
+
+
+def test_same_plate_other_gate_is_separate():
+    dedup = EntryDeduplicator(window_seconds=10)
+    assert dedup.check_and_record("MH12AB1234", "main", now=0)
+    assert dedup.check_and_record("MH12AB1234", "north", now=1)
+
+
+def test_repeat_sighting_slides_window():
+    dedup = EntryDeduplicator(window_seconds=10)
+    dedup.check_and_record("MH12AB1234", "main", now=0)
+    # Seen again at 8, so at 15 the car has only been gone for 7 seconds
+    assert not dedup.check_and_record("MH12AB1234", "main", now=8)
+    assert not dedup.check_and_record("MH12AB1234", "main", now=15)
+    assert dedup.check_and_record("MH12AB1234", "main", now=26)
+
+
+def test_expired_entries_are_evicted():
+    dedup = EntryDeduplicator(window_seconds=10)
+    dedup.check_and_record("MH12AB1234", "main", now=0)
+    dedup.check_and_record("KA01HA9999", "main", now=4)
+    dedup.check_and_record("DL3CAB0001", "main", now=12)
+    assert len(dedup) == 2
+    dedup.check_and_record("DL3CAB0001", "main", now=20)
+    assert len(dedup) == 1
+
+
+def test_forget_one_gate():
+    dedup = EntryDeduplicator(window_seconds=10)
+    dedup.check_and_record("MH12AB1234", "main", now=0)
+    dedup.check_and_record("MH12AB1234", "north", now=0)
+    dedup.forget("MH12AB1234", "main")
+    assert dedup.check_and_record("MH12AB1234", "main", now=1)
+    assert not dedup.check_and_record("MH12AB1234", "north", now=1)
+
+
+def test_forget_all_gates_on_exit():
+    dedup = EntryDeduplicator(window_seconds=10)
+    dedup.check_and_record("MH12AB1234", "main", now=0)
+    dedup.check_and_record("MH12AB1234", "north", now=0)
+    dedup.forget("MH12AB1234")
+    assert len(dedup) == 0
+    assert dedup.check_and_record("MH12AB1234", "main", now=1)
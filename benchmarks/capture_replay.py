@@ -0,0 +1,117 @@
+"""
+Frame-replay benchmark for `stream_and_auto_capture` in app.py.
+
+Replays the images in `test images /` as a fake camera stream (each image held for a
+few frames, like a car pulling up to the gate) and swaps Gemini for a fake model with a
+fixed latency, so the numbers only reflect the capture loop itself:
+
+    python benchmarks/capture_replay.py --loops 20 --model-latency 0.3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+
+from stats import print_results, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_DIR = os.path.join(ROOT, "test images ")
+FRAME_SIZE = (640, 480)
+
+sys.path.insert(0, ROOT)
+# app.py refuses to import without a key; the fake model never uses it
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+
+def load_frames(images_dir):
+    frames = []
+    for name in sorted(os.listdir(images_dir)):
+        image = cv2.imread(os.path.join(images_dir, name), cv2.IMREAD_COLOR)
+        if image is not None:
+            # Motion detection diffs consecutive frames, so they must share a size
+            frames.append(cv2.resize(image, FRAME_SIZE))
+    if not frames:
+        raise ValueError(f"No readable images in {images_dir}")
+    return frames
+
+
+class ReplayCamera:
+    """Stands in for cv2.VideoCapture and records the time spent on every frame."""
+
+    def __init__(self, frames, hold, loops):
+        self.sequence = [frame for _ in range(loops) for frame in frames for _ in range(hold)]
+        self.position = 0
+        self.frame_latencies = []
+        self._last_read = None
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        now = time.perf_counter()
+        if self._last_read is not None:
+            self.frame_latencies.append(now - self._last_read)
+        self._last_read = now
+
+        if self.position >= len(self.sequence):
+            return False, None
+        frame = self.sequence[self.position].copy()
+        self.position += 1
+        return True, frame
+
+    def release(self):
+        pass
+
+
+class FakeModel:
+    """Replaces process_vehicle_image with a fixed-latency answer."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.call_latencies = []
+
+    def __call__(self, image_data):
+        start = time.perf_counter()
+        time.sleep(self.latency)
+        self.call_latencies.append(time.perf_counter() - start)
+        return '{"number_plate": "MH12AB1234", "vehicle_type": "four_wheeler"}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay test images through the capture loop")
+    parser.add_argument("--images", default=IMAGES_DIR)
+    parser.add_argument("--hold", type=int, default=5, help="frames each image stays in view")
+    parser.add_argument("--loops", type=int, default=10, help="times to replay the whole image set")
+    parser.add_argument("--model-latency", type=float, default=0.0, help="seconds the fake model takes")
+    parser.add_argument("--cooldown", type=float, default=0.0, help="seconds between captures")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    from app import stream_and_auto_capture
+
+    camera = ReplayCamera(load_frames(args.images), args.hold, args.loops)
+    model = FakeModel(args.model_latency)
+
+    # Captured images are written to the working directory, keep them out of the repo
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            start = time.perf_counter()
+            stream_and_auto_capture("replay", camera=camera, recognize=model,
+                                    cooldown=args.cooldown, show_window=False)
+            elapsed = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+
+    print_results([
+        summarize("frame", camera.frame_latencies, elapsed),
+        summarize("model_call", model.call_latencies, elapsed),
+    ], as_json=args.json)
+
+
+if __name__ == "__main__":
+    main()
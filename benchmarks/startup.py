@@ -0,0 +1,79 @@
+"""
+Cold-start benchmark for the capture scripts.
+
+Imports the module in a fresh interpreter under `python -X importtime`, then reports
+the wall time to a usable module and the slowest imports:
+
+    python benchmarks/startup.py --module app --runs 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from stats import print_results, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_once(module):
+    """Import `module` in a new process. Returns (wall seconds, importtime stderr)."""
+    env = dict(os.environ)
+    # Startup must not depend on a real key; the clients are only built on first recognition
+    env.setdefault("GOOGLE_API_KEY", "benchmark")
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+    return elapsed, completed.stderr
+
+
+def slowest_imports(importtime_output, top):
+    """Parse `-X importtime` lines into the `top` slowest top-level imports by cumulative time."""
+    imports = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|", 1).split("|")]
+        # Nested imports are indented under their parent; only count each tree once
+        if not line.rsplit("|", 1)[1].startswith("  "):
+            imports.append({"module": name, "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+    return sorted(imports, key=lambda row: row["cumulative_ms"], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time")
+    parser.add_argument("--module", default="app", help="module to import from the repo root")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    latencies = []
+    output = ""
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        elapsed, output = import_once(args.module)
+        latencies.append(elapsed)
+    results = [summarize(f"import {args.module}", latencies, time.perf_counter() - start)]
+    slowest = slowest_imports(output, args.top)
+
+    if args.json:
+        print(json.dumps({"startup": results, "slowest_imports": slowest}, indent=2))
+        return
+
+    print_results(results)
+    print()
+    print(f"{'module':<50}{'self ms':>12}{'cumulative ms':>16}")
+    for row in slowest:
+        print(f"{row['module']:<50}{row['self_ms']:>12.1f}{row['cumulative_ms']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
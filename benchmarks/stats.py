@@ -0,0 +1,35 @@
+import json
+import math
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(name, latencies, elapsed, errors=0):
+    """Build a result row (latencies in seconds, reported in ms) for one scenario."""
+    values = sorted(latencies)
+    return {
+        "scenario": name,
+        "count": len(values),
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "throughput_per_s": round(len(values) / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+def print_results(results, as_json=False):
+    if as_json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'scenario':<20}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}")
+    for row in results:
+        print(f"{row['scenario']:<20}{row['count']:>8}{row['errors']:>8}{row['p50_ms']:>10}"
+              f"{row['p95_ms']:>10}{row['p99_ms']:>10}{row['throughput_per_s']:>10}")
@@ -1,48 +1,65 @@
 import os
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
 import json
-import google.generativeai as genai
 
-# Step 1: Load environment variables and configure Gemini
+# Step 1: Load environment variables
 load_dotenv()
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 if not GOOGLE_API_KEY:
     raise ValueError("Please set GOOGLE_API_KEY in your .env file.")
 
-genai.configure(api_key=GOOGLE_API_KEY)
-
-# Define the Pydantic model for structured output
-class VehicleData(BaseModel):
-    number_plate: str = Field(description="The number plate of the vehicle")
-    vehicle_type: str = Field(description="The type of vehicle (e.g., two_wheeler, four_wheeler)")
-
-# Initialize LangChain’s Gemini model (for text formatting)
-llm = ChatGoogleGenerativeAI(
-    model="gemini-1.5-flash",
-    google_api_key=GOOGLE_API_KEY,
-    temperature=0.0
-)
-
-# Set up the prompt template for formatting the output
-prompt_template = PromptTemplate(
-    template="""Format the following vehicle data as JSON:
+# Prompt for formatting the output (a plain string, so it costs nothing at import)
+PROMPT_TEMPLATE = """Format the following vehicle data as JSON:
     Number Plate: {number_plate}
     Vehicle Type: {vehicle_type}
     {parser_instructions}
-    """,
-    input_variables=["number_plate", "vehicle_type"],
-    partial_variables={"parser_instructions": PydanticOutputParser(pydantic_object=VehicleData).get_format_instructions()}
-)
+    """
+
+# Gemini, LangChain and Pydantic take seconds to import, so the clients are built
+# on first use and then reused for every image
+_clients = None
+
+def get_recognition_clients():
+    """Return the (Gemini model, LangChain formatting chain) pair, building it on first call."""
+    global _clients
+    if _clients is not None:
+        return _clients
+
+    import google.generativeai as genai
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_core.prompts import PromptTemplate
+    from langchain_core.output_parsers import PydanticOutputParser
+    from pydantic import BaseModel, Field
+
+    genai.configure(api_key=GOOGLE_API_KEY)
+
+    # Define the Pydantic model for structured output
+    class VehicleData(BaseModel):
+        number_plate: str = Field(description="The number plate of the vehicle")
+        vehicle_type: str = Field(description="The type of vehicle (e.g., two_wheeler, four_wheeler)")
+
+    # Initialize LangChain’s Gemini model (for text formatting)
+    llm = ChatGoogleGenerativeAI(
+        model="gemini-1.5-flash",
+        google_api_key=GOOGLE_API_KEY,
+        temperature=0.0
+    )
+
+    # Set up the output parser
+    parser = PydanticOutputParser(pydantic_object=VehicleData)
+
+    # Set up the prompt template for formatting the output
+    prompt_template = PromptTemplate(
+        template=PROMPT_TEMPLATE,
+        input_variables=["number_plate", "vehicle_type"],
+        partial_variables={"parser_instructions": parser.get_format_instructions()}
+    )
 
-# Set up the output parser
-parser = PydanticOutputParser(pydantic_object=VehicleData)
+    # Create the chain for formatting
+    chain = prompt_template | llm | parser
 
-# Create the chain for formatting
-chain = prompt_template | llm | parser
+    _clients = (genai.GenerativeModel("gemini-1.5-flash"), chain)
+    return _clients
 
 def process_vehicle_image(image_path: str) -> str:
     """
@@ -59,7 +76,7 @@ def process_vehicle_image(image_path: str) -> str:
         raise ValueError(f"Image file not found at: {image_path}")
 
     # Step 2: Send the image to Gemini 1.5 Flash
-    model = genai.GenerativeModel("gemini-1.5-flash")
+    model, chain = get_recognition_clients()
     response = model.generate_content([
         "Analyze this vehicle image and extract the number plate and vehicle type. Return the result in the format:\nNumber Plate: <plate>\nVehicle Type: <type>",
         {"mime_type": "image/jpeg", "data": image_data}  # Adjust mime_type if needed (e.g., "image/png")